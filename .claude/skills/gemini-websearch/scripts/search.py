@@ -1,41 +1,109 @@
-import subprocess
 import json
+import atexit
+import re
 import hashlib
+import random
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
+from datetime import datetime
 import os
 import sys
-import platform
+
+# asyncio, subprocess, platform and shutil are imported inside the functions
+# that run searches, so importing this module for the cache, validator or
+# analytics classes stays cheap.
+if TYPE_CHECKING:
+    import asyncio
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib
+    orjson = None
+
+# Bump when the cache key derivation or entry layout changes; old entries are
+# left behind in their own directory instead of being misread.
+CACHE_VERSION = "v2"
+
+# Minimum seconds between rewrites of the aggregate analytics file.
+ANALYTICS_FLUSH_INTERVAL = 5.0
+
+_WORD_RE = re.compile(r"\w+")
+
+# Seconds before the resolved Gemini CLI location is looked up again.
+GEMINI_COMMAND_TTL = 3600
+
+# Seconds before a single Gemini CLI search is abandoned.
+SEARCH_TIMEOUT = 120
+
+# Seconds a search may spend across all attempts and backoff before giving up.
+SEARCH_DEADLINE = 300
+
+# Minimum seconds left before the deadline for another attempt to be started.
+MIN_ATTEMPT_TIME = 10
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write via a per-process temp file and os.replace so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 
 class SearchCache:
-    """MD5-keyed cache with TTL."""
+    """BLAKE2-keyed cache with TTL."""
+    
+    # Directories already created in this process
+    _dirs_ensured: Set[Path] = set()
     
     def __init__(self, cache_dir: str = ".cache/gemini-searches", ttl: int = 3600):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_root = Path(cache_dir)
+        self.cache_dir = self.cache_root / CACHE_VERSION
+        if self.cache_dir not in SearchCache._dirs_ensured:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            SearchCache._dirs_ensured.add(self.cache_dir)
         self.ttl = ttl
     
     def _get_key(self, query: str, model: str) -> str:
-        """Generate MD5 cache key."""
-        return hashlib.md5(f"{query}:{model}".encode()).hexdigest()
+        """Generate a 16-char BLAKE2b cache key of ``query:model``."""
+        h = hashlib.blake2b(query.encode(), digest_size=8)
+        h.update(b":")
+        h.update(model.encode())
+        return h.hexdigest()
     
     def get(self, query: str, model: str) -> Optional[Dict]:
         """Retrieve cached result if valid."""
         key = self._get_key(query, model)
         cache_file = self.cache_dir / f"{key}.json"
         
-        if not cache_file.exists():
+        try:
+            st = cache_file.stat()
+        except FileNotFoundError:
             return None
         
-        with open(cache_file) as f:
-            cached = json.load(f)
+        # Check TTL against the write time so expired entries are never read
+        if time.time() - st.st_mtime > self.ttl:
+            cache_file.unlink(missing_ok=True)
+            return None
         
-        # Check TTL
-        cached_time = datetime.fromisoformat(cached["timestamp"])
-        if datetime.now() - cached_time > timedelta(seconds=self.ttl):
-            cache_file.unlink()
+        try:
+            cached = _loads(cache_file.read_bytes())
+        except FileNotFoundError:  # expired and removed by another process
             return None
         
         return cached["result"]
@@ -45,18 +113,20 @@ class SearchCache:
         key = self._get_key(query, model)
         cache_file = self.cache_dir / f"{key}.json"
         
-        with open(cache_file, 'w') as f:
-            json.dump({
-                "query": query,
-                "model": model,
-                "timestamp": datetime.now().isoformat(),
-                "result": result
-            }, f, indent=2)
+        _write_atomic(cache_file, _dumps({
+            "query": query,
+            "model": model,
+            "timestamp": datetime.now().isoformat(),
+            "result": result
+        }, indent=True))
     
     def clear(self):
-        """Clear all cached results."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
+        """Clear all cached results, including unversioned entries from older releases."""
+        for pattern in ("*.json", "*.tmp"):
+            for cache_file in self.cache_dir.glob(pattern):
+                cache_file.unlink(missing_ok=True)
+        for cache_file in self.cache_root.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
 
 
 class ResultValidator:
@@ -74,21 +144,25 @@ class ResultValidator:
     
     @staticmethod
     def calculate_relevance(query: str, result: Dict) -> float:
-        """Calculate relevance score based on query match."""
-        text = result.get("response", "").lower()
-        query_terms = query.lower().split()
+        """Calculate relevance score based on whole-word query matches."""
+        words = frozenset(_WORD_RE.findall(result.get("response", "").lower()))
+        query_terms = _WORD_RE.findall(query.lower())
 
         # Count query term matches (ignore "search" prefix if present)
         query_terms = [term for term in query_terms if term != "search"]
 
-        matches = sum(1 for term in query_terms if term in text)
+        matches = sum(1 for term in query_terms if term in words)
         relevance = matches / len(query_terms) if query_terms else 0
 
         return min(relevance, 1.0)
     
     @staticmethod
-    def score_quality(result: Dict, citations: List[Dict], query: str) -> float:
-        """Multi-factor quality score (0-1)."""
+    def score_quality(result: Dict, citations: List[Dict], query: str,
+                      relevance: Optional[float] = None) -> float:
+        """Multi-factor quality score (0-1).
+
+        Pass a precomputed ``relevance`` to avoid scoring the query match twice.
+        """
         score = 0.0
 
         # Response length (max 0.3) - longer responses indicate comprehensive results
@@ -109,7 +183,8 @@ class ResultValidator:
                     score += 0.1
 
         # Relevance to query (0.4) - check if response contains query terms
-        relevance = ResultValidator.calculate_relevance(query, result)
+        if relevance is None:
+            relevance = ResultValidator.calculate_relevance(query, result)
         score += relevance * 0.4
 
         return min(score, 1.0)
@@ -122,8 +197,8 @@ class ResultValidator:
         Note: min_citations defaults to 0 since Gemini CLI doesn't provide citations.
         """
         citations = ResultValidator.extract_citations(result)
-        quality = ResultValidator.score_quality(result, citations, query)
         relevance = ResultValidator.calculate_relevance(query, result)
+        quality = ResultValidator.score_quality(result, citations, query, relevance=relevance)
 
         if quality < min_quality:
             return False, quality, f"Quality {quality:.2f} below threshold {min_quality}"
@@ -138,30 +213,86 @@ class ResultValidator:
         return True, quality, "Valid"
 
 
+def _epoch_timestamp(value) -> Optional[float]:
+    """Convert a legacy ISO timestamp to epoch seconds; None if unparseable."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
 class SearchAnalytics:
-    """Tracks search analytics."""
+    """Tracks search analytics.
+
+    Aggregates are kept in memory and written back to ``log_file`` at most
+    every ANALYTICS_FLUSH_INTERVAL seconds and at exit. Per-query records are
+    appended to a ``.jsonl`` sidecar next to it. The log file is only read
+    on first access to ``stats``.
+    """
     
     def __init__(self, log_file: str = "search_analytics.json"):
         self.log_file = Path(log_file)
-        self.stats = self._load()
+        self.queries_file = self.log_file.with_suffix(".jsonl")
+        self._dirty = False
+        self._stats: Optional[Dict] = None
+        self._last_flush = time.time()
+        atexit.register(self._save)
+    
+    @property
+    def stats(self) -> Dict:
+        if self._stats is None:
+            self._stats = self._load()
+        return self._stats
     
     def _load(self) -> Dict:
         if self.log_file.exists():
-            with open(self.log_file) as f:
-                return json.load(f)
+            stats = _loads(self.log_file.read_bytes())
+            migrated = False
+            # Migrate query history from older logs into the sidecar, converting
+            # their ISO timestamps to the epoch seconds used by new records.
+            # Convert everything before appending so a bad record can't leave a
+            # partially migrated sidecar behind.
+            queries = stats.pop("queries", None)
+            if queries is not None:
+                for record in queries:
+                    record["timestamp"] = _epoch_timestamp(record.get("timestamp"))
+                for record in queries:
+                    self._append_query(record)
+                migrated = True
+            # Fold score lists from older logs into the running totals
+            scores = stats.pop("quality_scores", None)
+            if scores is not None:
+                stats.setdefault("quality_count", len(scores))
+                stats.setdefault("quality_sum", float(sum(scores)))
+                stats.setdefault("quality_sumsq", float(sum(q * q for q in scores)))
+                migrated = True
+            # Persist the migrated layout right away so it only ever runs once
+            if migrated:
+                _write_atomic(self.log_file, _dumps(stats, indent=True))
+            return stats
         return {
             "total_searches": 0,
             "cache_hits": 0,
             "cache_misses": 0,
             "avg_latency_ms": 0,
-            "quality_scores": [],
-            "failed_validations": 0,
-            "queries": []
+            "quality_count": 0,
+            "quality_sum": 0.0,
+            "quality_sumsq": 0.0,
+            "failed_validations": 0
         }
     
     def _save(self):
-        with open(self.log_file, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+        if not self._dirty:
+            return
+        _write_atomic(self.log_file, _dumps(self.stats, indent=True))
+        self._dirty = False
+        self._last_flush = time.time()
+    
+    def _append_query(self, record: Dict):
+        with open(self.queries_file, 'ab') as f:
+            f.write(_dumps(record) + b"\n")
     
     def log_search(self, query: str, cached: bool, latency_ms: float,
                    quality: Optional[float] = None, valid: bool = True):
@@ -178,85 +309,263 @@ class SearchAnalytics:
         self.stats["avg_latency_ms"] = (current_avg * (total - 1) + latency_ms) / total
         
         if quality is not None:
-            self.stats["quality_scores"].append(quality)
+            self.stats["quality_count"] += 1
+            self.stats["quality_sum"] += quality
+            self.stats["quality_sumsq"] += quality * quality
         
         if not valid:
             self.stats["failed_validations"] += 1
         
-        self.stats["queries"].append({
+        self._append_query({
             "query": query,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "cached": cached,
             "latency_ms": latency_ms,
             "quality": quality,
             "valid": valid
         })
         
-        self._save()
+        self._dirty = True
+        if time.time() - self._last_flush > ANALYTICS_FLUSH_INTERVAL:
+            self._save()
     
     def get_cache_hit_rate(self) -> float:
         total = self.stats["total_searches"]
         return self.stats["cache_hits"] / total if total > 0 else 0.0
     
     def get_avg_quality(self) -> float:
-        scores = self.stats["quality_scores"]
-        return sum(scores) / len(scores) if scores else 0.0
+        count = self.stats["quality_count"]
+        return self.stats["quality_sum"] / count if count else 0.0
+    
+    def get_quality_stddev(self) -> float:
+        count = self.stats["quality_count"]
+        if not count:
+            return 0.0
+        mean = self.stats["quality_sum"] / count
+        return max(self.stats["quality_sumsq"] / count - mean * mean, 0.0) ** 0.5
+
+
+_analytics: Dict[str, SearchAnalytics] = {}
 
 
-def get_gemini_command() -> List[str]:
+def _get_analytics(log_file: str) -> SearchAnalytics:
+    """Share one SearchAnalytics per log file so buffered stats aren't lost."""
+    analytics = _analytics.get(log_file)
+    if analytics is None:
+        analytics = _analytics[log_file] = SearchAnalytics(log_file)
+    return analytics
+
+
+def get_gemini_command() -> Tuple[str, ...]:
     """
     Get the correct command to invoke Gemini CLI based on the OS.
 
-    Returns a list of command arguments that can be used with subprocess.run.
+    Returns a tuple of command arguments that can be used with subprocess.run.
+    The lookup is cached and refreshed every GEMINI_COMMAND_TTL seconds.
     """
-    system = platform.system()
+    return _resolve_gemini_command(int(time.time() // GEMINI_COMMAND_TTL))
+
+
+@lru_cache(maxsize=1)
+def _resolve_gemini_command(_ttl_bucket: int) -> Tuple[str, ...]:
+    import platform
+    import shutil
+
+    # shutil.which honors PATHEXT on Windows, so gemini.cmd is found directly
+    gemini_path = shutil.which("gemini")
+
+    if platform.system() != "Windows":
+        if not gemini_path:
+            raise FileNotFoundError("Could not find gemini CLI. Please install it with: npm install -g @google/gemini-cli")
+        return (gemini_path,)
+
+    if gemini_path:
+        if gemini_path.lower().endswith(('.cmd', '.bat')):
+            return (gemini_path,)
+
+        node_modules_path = Path(gemini_path).parent / "node_modules" / "@google" / "gemini-cli" / "dist" / "index.js"
+        if node_modules_path.exists():
+            return ("node", str(node_modules_path))
 
-    if system == "Windows":
+        return ("bash", gemini_path)
+
+    for npm_prefix in _npm_prefixes():
+        node_path = Path(npm_prefix) / "node_modules" / "@google" / "gemini-cli" / "dist" / "index.js"
+        if node_path.exists():
+            return ("node", str(node_path))
+
+    raise FileNotFoundError("Could not find gemini CLI. Please install it with: npm install -g @google/gemini-cli")
+
+
+def _npm_prefixes() -> Iterator[str]:
+    """Yield candidate npm global prefixes, asking npm itself only as a last resort."""
+    import shutil
+    import subprocess
+
+    env_prefix = os.environ.get("NPM_CONFIG_PREFIX")
+    if env_prefix:
+        yield env_prefix
+
+    appdata = os.environ.get("APPDATA")
+    if appdata:
+        yield os.path.join(appdata, "npm")
+
+    npm = shutil.which("npm")
+    if npm:
         try:
-            gemini_path = subprocess.check_output(
-                ["where", "gemini"],
+            yield subprocess.check_output(
+                [npm, "config", "get", "prefix"],
                 stderr=subprocess.DEVNULL,
                 text=True
-            ).strip().split('\n')[0]
+            ).strip()
+        except (subprocess.CalledProcessError, OSError):
+            pass
 
-            if not gemini_path or not Path(gemini_path).exists():
-                raise FileNotFoundError("gemini not found in PATH")
 
-            if gemini_path.endswith('.cmd') or gemini_path.endswith('.bat'):
-                return [gemini_path]
+def _search_context() -> Tuple[SearchCache, SearchAnalytics]:
+    """Build the cache and analytics objects configured by the environment."""
+    cache_dir = os.getenv("SEARCH_CACHE_DIR", ".cache/gemini-searches")
+    cache_ttl = int(os.getenv("SEARCH_CACHE_TTL", "3600"))
+    analytics_log = os.getenv("ANALYTICS_LOG", "search_analytics.json")
+    
+    return SearchCache(cache_dir, cache_ttl), _get_analytics(analytics_log)
+
+
+def _gemini_args(query: str, model: str) -> List[str]:
+    """Build the headless Gemini CLI invocation for a query."""
+    prompt = f'/tool:google_web_search query:"{query}" raw:true'
+    return list(get_gemini_command()) + [
+        "-p", prompt,
+        "--yolo",
+        "--output-format", "json",
+        "-m", model
+    ]
+
+
+def _parse_search_output(stdout: bytes, query: str, model: str, validate: bool,
+                         min_quality: float, min_citations: int,
+                         min_relevance: float) -> Dict:
+    """Parse raw Gemini CLI JSON output and attach validation if enabled."""
+    search_result = _loads(stdout)
+    if not isinstance(search_result, dict):
+        raise ValueError(f"Expected a JSON object, got {type(search_result).__name__}")
+    search_result["query"] = query
+    search_result["model"] = model
+    search_result["success"] = True
+    
+    if validate:
+        valid, quality, message = ResultValidator.validate(
+            search_result, query, min_quality, min_citations, min_relevance
+        )
+        search_result["validation"] = {
+            "valid": valid,
+            "quality": quality,
+            "message": message
+        }
+    
+    return search_result
+
+
+def _cached_search(cache: SearchCache, analytics: SearchAnalytics, use_cache: bool,
+                   query: str, model: str, start_time: float) -> Optional[Dict]:
+    """Return a cached result (logging the hit), or None on a miss."""
+    if not use_cache:
+        return None
+    cached_result = cache.get(query, model)
+    if cached_result:
+        latency_ms = (time.time() - start_time) * 1000
+        analytics.log_search(query, True, latency_ms)
+    return cached_result
+
+
+def _record_search(cache: SearchCache, analytics: SearchAnalytics, use_cache: bool,
+                   query: str, model: str, search_result: Dict, start_time: float):
+    """Cache a fresh search result and log it to analytics."""
+    validation = search_result.get("validation")
+    quality = validation["quality"] if validation else None
+    valid = validation["valid"] if validation else True
+    
+    if use_cache:
+        cache.set(query, model, search_result)
+    
+    latency_ms = (time.time() - start_time) * 1000
+    analytics.log_search(query, False, latency_ms, quality, valid)
 
-            node_modules_path = str(Path(gemini_path).parent / "node_modules" / "@google" / "gemini-cli" / "dist" / "index.js")
-            if Path(node_modules_path).exists():
-                return ["node", node_modules_path]
 
-            return ["bash", gemini_path] if Path(gemini_path).exists() else ["node", node_modules_path]
+def _retry_delay(retries: int, retry_budget: int, deadline: float) -> Optional[float]:
+    """
+    Jittered exponential backoff before the next retry, or None if no retry is
+    allowed or the retry could not get MIN_ATTEMPT_TIME before ``deadline``.
+    """
+    if retries >= retry_budget:
+        return None
+    delay = 2 ** (retries + 1) + random.uniform(0, 1)
+    if time.time() + delay + MIN_ATTEMPT_TIME > deadline:
+        return None
+    return delay
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            try:
-                npm_prefix = subprocess.check_output(
-                    ["npm", "config", "get", "prefix"],
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                ).strip()
-
-                node_path = Path(npm_prefix) / "node_modules" / "@google" / "gemini-cli" / "dist" / "index.js"
-                if node_path.exists():
-                    return ["node", str(node_path)]
-            except:
-                pass
 
-            raise FileNotFoundError("Could not find gemini CLI. Please install it with: npm install -g @google/gemini-cli")
-    else:
+_SearchStep = Union[Tuple[List[str], float], float]
+
+
+def _search_attempts(query: str, model: str, validate: bool,
+                     min_quality: float, min_citations: int, min_relevance: float,
+                     retry_on_fail: bool, max_retries: int
+                     ) -> Generator[_SearchStep, Optional[bytes], Dict]:
+    """
+    Attempt, retry and backoff decisions shared by the sync and async searches.
+
+    Yields ``(args, timeout)`` when the Gemini CLI should run; the caller sends
+    back its stdout, or throws ``subprocess.TimeoutExpired`` or
+    ``subprocess.CalledProcessError`` into the generator. Yields a delay in
+    seconds when the caller should back off before the next attempt. Returns
+    the final result. The deadline starts on the first step.
+    """
+    import subprocess
+
+    retry_budget = max_retries if retry_on_fail else 0
+    deadline = time.time() + SEARCH_DEADLINE
+    retries = 0
+    last_result = None
+    while True:
+        timeout = min(SEARCH_TIMEOUT, deadline - time.time())
+        if last_result is not None and timeout < MIN_ATTEMPT_TIME:
+            # Time was lost waiting to start the retry; don't launch a doomed attempt
+            return last_result
+        
         try:
-            result = subprocess.run(
-                ["which", "gemini"],
-                capture_output=True,
-                check=True,
-                text=True
+            stdout = yield _gemini_args(query, model), timeout
+            search_result = _parse_search_output(
+                stdout, query, model, validate,
+                min_quality, min_citations, min_relevance
             )
-            return [result.stdout.strip()]
-        except subprocess.CalledProcessError:
-            raise FileNotFoundError("Could not find gemini CLI. Please install it with: npm install -g @google/gemini-cli")
+        except subprocess.TimeoutExpired as e:
+            last_result = {
+                "query": query,
+                "error": f"Search timeout after {e.timeout:.0f}s",
+                "success": False
+            }
+        # ValueError covers JSONDecodeError and non-object output
+        except (subprocess.CalledProcessError, ValueError) as e:
+            return {
+                "query": query,
+                "error": f"Search failed: {str(e)}",
+                "success": False
+            }
+        else:
+            validation = search_result.get("validation")
+            if validation is None or validation["valid"]:
+                return search_result
+            last_result = search_result
+        
+        delay = _retry_delay(retries, retry_budget, deadline)
+        if delay is None:
+            return last_result
+        retries += 1
+        if last_result.get("success"):
+            print(f"Validation failed for {query!r}: {last_result['validation']['message']}. "
+                  f"Retrying ({retries}/{max_retries})...", file=sys.stderr)
+        yield delay
 
 
 def search_gemini(query: str, model: str = "gemini-2.5-flash",
@@ -271,105 +580,150 @@ def search_gemini(query: str, model: str = "gemini-2.5-flash",
           --yolo --output-format json
 
     """
-    cache_dir = os.getenv("SEARCH_CACHE_DIR", ".cache/gemini-searches")
-    cache_ttl = int(os.getenv("SEARCH_CACHE_TTL", "3600"))
-    analytics_log = os.getenv("ANALYTICS_LOG", "search_analytics.json")
-    
-    cache = SearchCache(cache_dir, cache_ttl)
-    analytics = SearchAnalytics(analytics_log)
+    import subprocess
+
+    cache, analytics = _search_context()
     
     start_time = time.time()
     
-    # Check cache
-    if use_cache:
-        cached_result = cache.get(query, model)
-        if cached_result:
-            latency_ms = (time.time() - start_time) * 1000
-            analytics.log_search(query, True, latency_ms)
-            return cached_result
+    cached_result = _cached_search(cache, analytics, use_cache, query, model, start_time)
+    if cached_result:
+        return cached_result
     
     # Execute headless search with retry logic
-    attempt = 0
-    while attempt <= (max_retries if retry_on_fail else 0):
+    steps = _search_attempts(query, model, validate, min_quality, min_citations,
+                             min_relevance, retry_on_fail, max_retries)
+    stdout, error = None, None
+    while True:
         try:
-            # Get the correct gemini command for this OS
-            gemini_cmd = get_gemini_command()
-
-            # Headless mode command
-            prompt = f'/tool:google_web_search query:"{query}" raw:true'
-
-            result = subprocess.run(
-                gemini_cmd + [
-                    "-p", prompt,
-                    "--yolo",
-                    "--output-format", "json",
-                    "-m", model
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                check=True
-            )
+            step = steps.throw(error) if error else steps.send(stdout)
+        except StopIteration as stop:
+            search_result = stop.value
+            break
+        stdout, error = None, None
+        
+        if isinstance(step, tuple):
+            args, timeout = step
+            try:
+                stdout = subprocess.run(
+                    args,
+                    capture_output=True,
+                    timeout=timeout,
+                    check=True
+                ).stdout
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+                error = e
+        else:
+            time.sleep(step)
+    
+    if search_result["success"]:
+        _record_search(cache, analytics, use_cache, query, model, search_result, start_time)
+    
+    return search_result
+
+
+async def _search_gemini_async(query: str, model: str, semaphore: "asyncio.Semaphore",
+                               use_cache: bool, validate: bool,
+                               min_quality: float, min_citations: int,
+                               min_relevance: float,
+                               retry_on_fail: bool, max_retries: int) -> Dict:
+    """
+    Async counterpart of search_gemini used by search_gemini_batch.
+
+    Unexpected errors become an error result for this query only, so one bad
+    query does not abort the rest of the batch.
+    """
+    import asyncio
+    import subprocess
 
-            # Parse JSON response
-            search_result = json.loads(result.stdout)
-            search_result["query"] = query
-            search_result["model"] = model
-            search_result["success"] = True
+    try:
+        cache, analytics = _search_context()
+        
+        start_time = time.time()
+        
+        # Check cache before taking a subprocess slot
+        cached_result = _cached_search(cache, analytics, use_cache, query, model, start_time)
+        if cached_result:
+            return cached_result
+        
+        steps = _search_attempts(query, model, validate, min_quality, min_citations,
+                                 min_relevance, retry_on_fail, max_retries)
+        stdout, error = None, None
+        while True:
+            # Steps advance while holding a slot, so the deadline and each attempt's
+            # timeout don't count time spent queued behind other searches
+            async with semaphore:
+                try:
+                    step = steps.throw(error) if error else steps.send(stdout)
+                except StopIteration as stop:
+                    search_result = stop.value
+                    break
+                stdout, error = None, None
             
-            # Validate if enabled
-            if validate:
-                valid, quality, message = ResultValidator.validate(
-                    search_result, query, min_quality, min_citations, min_relevance
-                )
-                search_result["validation"] = {
-                    "valid": valid,
-                    "quality": quality,
-                    "message": message
-                }
-                
-                if not valid and retry_on_fail and attempt < max_retries:
-                    attempt += 1
-                    print(f"Validation failed: {message}. Retrying ({attempt}/{max_retries})...", 
-                          file=sys.stderr)
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                if isinstance(step, tuple):
+                    args, timeout = step
+                    proc = await asyncio.create_subprocess_exec(
+                        *args,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    try:
+                        out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        try:
+                            proc.kill()
+                        except ProcessLookupError:  # exited just as the timeout fired
+                            pass
+                        await proc.wait()
+                        error = subprocess.TimeoutExpired(args, timeout)
+                    else:
+                        if proc.returncode != 0:
+                            error = subprocess.CalledProcessError(proc.returncode, args, out, err)
+                        else:
+                            stdout = out
                     continue
-            else:
-                quality = None
-                valid = True
-            
-            # Cache result
-            if use_cache:
-                cache.set(query, model, search_result)
-            
-            # Log analytics
-            latency_ms = (time.time() - start_time) * 1000
-            analytics.log_search(query, False, latency_ms, quality, valid)
-            
-            return search_result
-            
-        except subprocess.TimeoutExpired:
-            attempt += 1
-            if attempt > max_retries:
-                return {
-                    "query": query,
-                    "error": "Search timeout after 30s",
-                    "success": False
-                }
-            time.sleep(2 ** attempt)
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            return {
-                "query": query,
-                "error": f"Search failed: {str(e)}",
-                "success": False
-            }
-    
-    return {
-        "query": query,
-        "error": "Max retries exceeded",
-        "success": False
-    }
+        
+            await asyncio.sleep(step)
+        
+        if search_result["success"]:
+            _record_search(cache, analytics, use_cache, query, model, search_result, start_time)
+        
+        return search_result
+    except Exception as e:
+        return {
+            "query": query,
+            "error": f"Search failed: {type(e).__name__}: {e}",
+            "success": False
+        }
+
+
+async def search_gemini_batch(queries: List[str], model: str = "gemini-2.5-flash",
+                              concurrency: int = 8,
+                              use_cache: bool = True, validate: bool = False,
+                              min_quality: float = 0.6, min_citations: int = 2,
+                              min_relevance: float = 0.5,
+                              retry_on_fail: bool = False,
+                              max_retries: int = 2) -> List[Dict]:
+    """
+    Execute several Gemini searches concurrently.
+
+    At most ``concurrency`` Gemini CLI processes run at once. Results are
+    returned in the same order as ``queries``.
+    """
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(
+        _search_gemini_async(
+            query, model, semaphore, use_cache, validate,
+            min_quality, min_citations, min_relevance,
+            retry_on_fail, max_retries
+        )
+        for query in queries
+    ))
 
 
 if __name__ == "__main__":
@@ -387,12 +741,19 @@ if __name__ == "__main__":
     parser.add_argument("--min-relevance", type=float, default=0.5)
     parser.add_argument("--retry-on-fail", action="store_true")
     parser.add_argument("--max-retries", type=int, default=2)
+    parser.add_argument("--batch-file", help="File with one query per line to search concurrently")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max concurrent searches in batch mode")
     parser.add_argument("--show-analytics", action="store_true")
     parser.add_argument("--clear-cache", action="store_true")
     parser.add_argument("--output", help="Output file for results")
     
     args = parser.parse_args()
     
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.batch_file and args.query:
+        parser.error("give either a query or --batch-file, not both")
+    
     if args.clear_cache:
         cache = SearchCache()
         cache.clear()
@@ -403,17 +764,13 @@ if __name__ == "__main__":
         analytics = SearchAnalytics()
         print(f"Total searches: {analytics.stats['total_searches']}")
         print(f"Cache hit rate: {analytics.get_cache_hit_rate():.1%}")
-        print(f"Avg quality: {analytics.get_avg_quality():.2f}")
+        print(f"Avg quality: {analytics.get_avg_quality():.2f} "
+              f"(stddev {analytics.get_quality_stddev():.2f})")
         print(f"Avg latency: {analytics.stats['avg_latency_ms']:.0f}ms")
         print(f"Failed validations: {analytics.stats['failed_validations']}")
         sys.exit(0)
     
-    if not args.query:
-        parser.print_help()
-        sys.exit(1)
-    
-    result = search_gemini(
-        args.query,
+    options = dict(
         model=args.model,
         use_cache=not args.no_cache,
         validate=args.validate,
@@ -424,10 +781,22 @@ if __name__ == "__main__":
         max_retries=args.max_retries
     )
     
-    output = json.dumps(result, indent=2)
+    if args.batch_file:
+        import asyncio
+
+        queries = [line.strip() for line in Path(args.batch_file).read_text().splitlines()
+                   if line.strip()]
+        result = asyncio.run(search_gemini_batch(queries, concurrency=args.concurrency, **options))
+    elif args.query:
+        result = search_gemini(args.query, **options)
+    else:
+        parser.print_help()
+        sys.exit(1)
+    
+    output = _dumps(result, indent=True)
     
     if args.output:
-        Path(args.output).write_text(output)
+        Path(args.output).write_bytes(output)
         print(f"Results saved to {args.output}")
     else:
-        print(output)
+        print(output.decode())